@@ -1,6 +1,9 @@
+from datetime import date
 from fastapi import APIRouter, HTTPException, Depends
+from pymongo.errors import PyMongoError
 from app.models.schemas import WeddingCreateSchema, WeddingUpdateSchema
 from app.services.wedding_service import WeddingService
+from app.services.archive_service import ArchiveService
 from app.utils.jwt_handler import JWTHandler
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
@@ -22,6 +25,16 @@ def create_wedding(wedding: WeddingCreateSchema, svc: WeddingService = Depends(g
     except ValueError as e:
         raise HTTPException(400, str(e))
 
+@router.post("/archive")
+def archive_weddings(before_date: date | None = None, svc: WeddingService = Depends(get_wedding_service)):
+    cutoff = before_date.isoformat() if before_date else ArchiveService.cutoff_date()
+    try:
+        return {"success": True, "data": svc.archive_weddings(cutoff)}
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+    except PyMongoError as e:
+        raise HTTPException(500, f"Archiving failed: {e}")
+
 @router.get("/{wedding_id}")
 def get_wedding(wedding_id: str, svc: WeddingService = Depends(get_wedding_service)):
     try:
@@ -44,5 +57,5 @@ def delete_wedding(wedding_id: str, svc: WeddingService = Depends(get_wedding_se
         raise HTTPException(404, str(e))
 
 @router.get("/")
-def list_weddings(svc: WeddingService = Depends(get_wedding_service)):
-    return {"success": True, "data": svc.list_weddings()}
+def list_weddings(include_archived: bool = False, svc: WeddingService = Depends(get_wedding_service)):
+    return {"success": True, "data": svc.list_weddings(include_archived)}
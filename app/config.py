@@ -6,6 +6,10 @@ class Settings(BaseSettings):
     JWT_SECRET: str = "change-me-to-secure-secret"
     JWT_ALGORITHM: str = "HS256"
     JWT_EXP_HOURS: int = 3
+    ARCHIVE_AFTER_DAYS: int = 365
+    ARCHIVE_INTERVAL_HOURS: int = 24
+    ARCHIVE_COMPRESSOR: str = "zstd"
+    ARCHIVE_LEASE_MINUTES: int = 60
 
     class Config:
         env_file = ".env"
@@ -1,4 +1,5 @@
 from pymongo import MongoClient
+from pymongo.errors import CollectionInvalid
 from app.config import settings
 
 _client = MongoClient(settings.MONGO_URI)
@@ -11,6 +12,33 @@ def get_org_collection(org_name: str):
     db_name = f"org_{org_name}"
     return _client[db_name]["data"]
 
+def get_org_archive_collection(org_name: str):
+    """
+    Return a reference to collection 'archive' in database org_<org_name>.
+    Holds past weddings moved out of 'data' to keep the working set small.
+    """
+    db_name = f"org_{org_name}"
+    return _client[db_name]["archive"]
+
+def ensure_org_archive_collection(org_name: str):
+    """
+    Create the archive collection with block compression if it does not exist yet.
+    """
+    db_name = f"org_{org_name}"
+    db = _client[db_name]
+    if "archive" not in db.list_collection_names():
+        options = {}
+        if settings.ARCHIVE_COMPRESSOR:
+            options["storageEngine"] = {
+                "wiredTiger": {"configString": f"block_compressor={settings.ARCHIVE_COMPRESSOR}"}
+            }
+        try:
+            db.create_collection("archive", **options)
+        except CollectionInvalid:
+            # created concurrently
+            pass
+    return db["archive"]
+
 def drop_org_database(org_name: str):
     db_name = f"org_{org_name}"
     _client.drop_database(db_name)
@@ -1,7 +1,9 @@
+import asyncio
 from fastapi import FastAPI
 from app.api.org_router import router as org_router
 from app.api.admin_router import router as admin_router
 from app.api.wedding_router import router as wedding_router
+from app.services.archive_service import ArchiveService
 from app.config import settings
 
 app = FastAPI(
@@ -16,6 +18,18 @@ app.include_router(org_router)
 app.include_router(admin_router)
 app.include_router(wedding_router)
 
+@app.on_event("startup")
+async def start_archiver():
+    # ARCHIVE_INTERVAL_HOURS <= 0 disables the background mover
+    if settings.ARCHIVE_INTERVAL_HOURS > 0:
+        app.state.archiver = asyncio.create_task(ArchiveService().run_forever())
+
+@app.on_event("shutdown")
+async def stop_archiver():
+    task = getattr(app.state, "archiver", None)
+    if task:
+        task.cancel()
+
 @app.get("/")
 def root():
     return {"message": "Wedding Company Service running"}
@@ -1,4 +1,5 @@
-from pydantic import BaseModel, EmailStr
+from datetime import date
+from pydantic import BaseModel, EmailStr, field_validator
 
 class OrgCreateSchema(BaseModel):
     organization_name: str
@@ -21,6 +22,12 @@ class AdminLoginSchema(BaseModel):
 class TokenResponse(BaseModel):
     access_token: str
 
+def _iso_date(value: str | None) -> str | None:
+    # stored as "YYYY-MM-DD" so string comparisons (archive cutoff) follow date order
+    if value is None:
+        return value
+    return date.fromisoformat(value).isoformat()
+
 class WeddingCreateSchema(BaseModel):
     bride_name: str
     groom_name: str
@@ -28,6 +35,11 @@ class WeddingCreateSchema(BaseModel):
     venue: str
     budget: float | None = None
 
+    @field_validator("wedding_date")
+    @classmethod
+    def validate_wedding_date(cls, value):
+        return _iso_date(value)
+
 class WeddingUpdateSchema(BaseModel):
     bride_name: str | None = None
     groom_name: str | None = None
@@ -35,6 +47,11 @@ class WeddingUpdateSchema(BaseModel):
     venue: str | None = None
     budget: float | None = None
 
+    @field_validator("wedding_date")
+    @classmethod
+    def validate_wedding_date(cls, value):
+        return _iso_date(value)
+
 class WeddingSchema(WeddingCreateSchema):
     id: str
     organization_name: str
@@ -1,10 +1,12 @@
 from app.db import master_db
 from bson import ObjectId
+from pymongo.errors import DuplicateKeyError
 
 class MasterRepo:
     def __init__(self):
         self.orgs = master_db["orgs"]
         self.admins = master_db["admins"]
+        self.archive_leases = master_db["archive_leases"]
 
     def find_org(self, organization_name: str):
         return self.orgs.find_one({"organization_name": organization_name})
@@ -16,9 +18,28 @@ class MasterRepo:
             "admin_id": ObjectId(admin_id)
         })
 
+    def list_org_names(self):
+        return [o["organization_name"] for o in self.orgs.find({}, {"organization_name": 1})]
+
     def delete_org(self, organization_name: str):
         return self.orgs.delete_one({"organization_name": organization_name})
 
+    # Archive leases
+    def acquire_archive_lease(self, organization_name: str, owner: str, now, expires_at) -> bool:
+        # a live lease makes the filter miss, and the upsert then collides on _id
+        try:
+            self.archive_leases.find_one_and_update(
+                {"_id": organization_name, "expires_at": {"$lt": now}},
+                {"$set": {"owner": owner, "expires_at": expires_at}},
+                upsert=True
+            )
+            return True
+        except DuplicateKeyError:
+            return False
+
+    def release_archive_lease(self, organization_name: str, owner: str):
+        return self.archive_leases.delete_one({"_id": organization_name, "owner": owner})
+
     # Admins
     def create_admin(self, email: str, hashed_password: str, organization_name: str):
         res = self.admins.insert_one({
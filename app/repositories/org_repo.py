@@ -1,29 +1,96 @@
-from app.db import get_org_collection
+from app.db import get_org_collection, get_org_archive_collection, ensure_org_archive_collection
 from bson import ObjectId
+from pymongo import ASCENDING, UpdateOne
 from typing import List, Dict, Any
 
 class OrgRepo:
     def __init__(self, org_name: str):
+        self.org_name = org_name
         self.collection = get_org_collection(org_name)
+        self.archive = get_org_archive_collection(org_name)
     
     def create_wedding(self, wedding_data: Dict[str, Any]) -> str:
         result = self.collection.insert_one(wedding_data)
         return str(result.inserted_id)
     
     def get_wedding(self, wedding_id: str) -> Dict[str, Any]:
-        return self.collection.find_one({"_id": ObjectId(wedding_id)})
+        wedding = self.collection.find_one({"_id": ObjectId(wedding_id)})
+        if wedding is None:
+            wedding = self.archive.find_one({"_id": ObjectId(wedding_id)})
+        return wedding
     
     def update_wedding(self, wedding_id: str, update_data: Dict[str, Any]) -> bool:
         result = self.collection.update_one(
             {"_id": ObjectId(wedding_id)}, 
             {"$set": update_data}
         )
+        if result.matched_count == 0:
+            result = self.archive.update_one(
+                {"_id": ObjectId(wedding_id)},
+                {"$set": update_data}
+            )
         return result.modified_count > 0
     
     def delete_wedding(self, wedding_id: str) -> bool:
-        result = self.collection.delete_one({"_id": ObjectId(wedding_id)})
-        return result.deleted_count > 0
+        # clear both tiers so a copy made by an in-flight archive run does not survive
+        active = self.collection.delete_one({"_id": ObjectId(wedding_id)})
+        archived = self.archive.delete_one({"_id": ObjectId(wedding_id)})
+        return active.deleted_count + archived.deleted_count > 0
     
-    def list_weddings(self, org_name: str) -> List[Dict[str, Any]]:
-        return list(self.collection.find({"type": "wedding"}))
-    
\ No newline at end of file
+    def restore_wedding(self, wedding_id: str) -> bool:
+        """
+        Move an archived wedding back into 'data'. Returns False if it is not archived.
+        """
+        wedding = self.archive.find_one({"_id": ObjectId(wedding_id)})
+        if wedding is None:
+            return False
+        self.collection.replace_one({"_id": wedding["_id"]}, wedding, upsert=True)
+        self.archive.delete_one({"_id": wedding["_id"]})
+        return True
+    
+    def list_weddings(self, org_name: str, include_archived: bool = False) -> List[Dict[str, Any]]:
+        weddings = list(self.collection.find({"type": "wedding"}))
+        if include_archived:
+            weddings.extend(self.archive.find({"type": "wedding"}))
+        return weddings
+
+    def archive_weddings(self, cutoff_date: str, batch_size: int = 500) -> int:
+        """
+        Move weddings dated before cutoff_date (ISO string) from 'data' to 'archive'.
+        Documents are copied into the archive before being removed from 'data',
+        so an interrupted run can simply be repeated. Each removal re-checks the
+        archive filter and returns the latest version, so an update that lands
+        mid-batch is carried over (or keeps the wedding active) instead of lost.
+        Callers should hold the organization's archive lease (ArchiveService.archive_org).
+        """
+        ensure_org_archive_collection(self.org_name)
+        self.collection.create_index([("type", ASCENDING), ("wedding_date", ASCENDING)])
+
+        moved = 0
+        # only ISO dates compare correctly as strings; skip anything else
+        query = {"type": "wedding", "wedding_date": {"$lt": cutoff_date, "$regex": r"^\d{4}-\d{2}-\d{2}"}}
+        while True:
+            batch = list(self.collection.find(query).limit(batch_size))
+            if not batch:
+                break
+            # never overwrite a copy that is already archived
+            self.archive.bulk_write([
+                UpdateOne(
+                    {"_id": d["_id"]},
+                    {"$setOnInsert": {k: v for k, v in d.items() if k != "_id"}},
+                    upsert=True
+                )
+                for d in batch
+            ])
+            for d in batch:
+                current = self.collection.find_one_and_delete({"_id": d["_id"], **query})
+                if current is None:
+                    # only a wedding re-dated past the cutoff is still active; any
+                    # other miss means it was moved or deleted elsewhere, so the
+                    # archive copy is left alone
+                    if self.collection.find_one({"_id": d["_id"]}, {"_id": 1}) is not None:
+                        self.archive.delete_one({"_id": d["_id"]})
+                    continue
+                self.archive.replace_one({"_id": d["_id"]}, current, upsert=True)
+                moved += 1
+        return moved
@@ -0,0 +1,52 @@
+import asyncio
+import logging
+import uuid
+from datetime import datetime, timedelta
+from app.config import settings
+from app.repositories.master_repo import MasterRepo
+from app.repositories.org_repo import OrgRepo
+from typing import Dict
+
+logger = logging.getLogger(__name__)
+
+class ArchiveService:
+    def __init__(self):
+        self.repo = MasterRepo()
+
+    @staticmethod
+    def cutoff_date() -> str:
+        cutoff = datetime.utcnow() - timedelta(days=settings.ARCHIVE_AFTER_DAYS)
+        return cutoff.date().isoformat()
+
+    def archive_org(self, org_name: str, cutoff: str) -> int:
+        # one mover per organization, shared by every worker and the manual endpoint
+        owner = uuid.uuid4().hex
+        now = datetime.utcnow()
+        expires_at = now + timedelta(minutes=settings.ARCHIVE_LEASE_MINUTES)
+        if not self.repo.acquire_archive_lease(org_name, owner, now, expires_at):
+            raise ValueError("Archiving already in progress for this organization")
+        try:
+            return OrgRepo(org_name).archive_weddings(cutoff)
+        finally:
+            self.repo.release_archive_lease(org_name, owner)
+
+    def archive_all(self) -> Dict[str, int]:
+        cutoff = self.cutoff_date()
+        moved = {}
+        for org_name in self.repo.list_org_names():
+            try:
+                moved[org_name] = self.archive_org(org_name, cutoff)
+            except ValueError:
+                logger.info("Skipping %s, archiving already in progress", org_name)
+            except Exception:
+                logger.exception("Archiving failed for organization %s", org_name)
+        return moved
+
+    async def run_forever(self):
+        while True:
+            try:
+                moved = await asyncio.to_thread(self.archive_all)
+                logger.info("Archived weddings before %s: %s", self.cutoff_date(), moved)
+            except Exception:
+                logger.exception("Archive run failed")
+            await asyncio.sleep(settings.ARCHIVE_INTERVAL_HOURS * 3600)
@@ -1,5 +1,5 @@
 from app.repositories.master_repo import MasterRepo
-from app.db import get_org_collection, drop_org_database
+from app.db import get_org_collection, get_org_archive_collection, ensure_org_archive_collection, drop_org_database
 from app.utils.hashing import Hasher
 
 class OrgService:
@@ -45,21 +45,24 @@ class OrgService:
             if self.repo.find_org(new_organization_name):
                 raise ValueError("New organization name already exists")
 
-            # Copy existing data to new db/collection
-            old_coll = get_org_collection(organization_name)
-            new_coll = get_org_collection(new_organization_name)
+            # Copy existing data and archive to new db/collections
+            copies = [
+                (get_org_collection(organization_name), get_org_collection(new_organization_name)),
+                (get_org_archive_collection(organization_name), ensure_org_archive_collection(new_organization_name)),
+            ]
 
             # stream copy (simple)
-            docs = old_coll.find({})
-            batch = []
-            for d in docs:
-                if "_id" in d:
-                    d.pop("_id")
-                batch.append(d)
-                if len(batch) >= 500:
-                    new_coll.insert_many(batch); batch = []
-            if batch:
-                new_coll.insert_many(batch)
+            for old_coll, new_coll in copies:
+                docs = old_coll.find({})
+                batch = []
+                for d in docs:
+                    if "_id" in d:
+                        d.pop("_id")
+                    batch.append(d)
+                    if len(batch) >= 500:
+                        new_coll.insert_many(batch); batch = []
+                if batch:
+                    new_coll.insert_many(batch)
 
             # Update master repo record
             self.repo.orgs.update_one(
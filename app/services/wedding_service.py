@@ -1,4 +1,5 @@
 from app.repositories.org_repo import OrgRepo
+from app.services.archive_service import ArchiveService
 from app.models.schemas import WeddingCreateSchema, WeddingUpdateSchema
 from typing import Dict, Any, List
 
@@ -26,6 +27,9 @@ class WeddingService:
         update_dict = {k: v for k, v in update_data.dict().items() if v is not None}
         if not self.repo.update_wedding(wedding_id, update_dict):
             raise ValueError("Wedding not found or no changes made")
+        # an archived wedding moved to a recent date belongs in the active set again
+        if update_dict.get("wedding_date", "") >= ArchiveService.cutoff_date():
+            self.repo.restore_wedding(wedding_id)
         return self.get_wedding(wedding_id)
     
     def delete_wedding(self, wedding_id: str) -> Dict[str, str]:
@@ -33,10 +37,17 @@ class WeddingService:
             raise ValueError("Wedding not found")
         return {"message": "Wedding deleted"}
     
-    def list_weddings(self) -> List[Dict[str, Any]]:
-        weddings = self.repo.list_weddings(self.org_name)
+    def list_weddings(self, include_archived: bool = False) -> List[Dict[str, Any]]:
+        weddings = self.repo.list_weddings(self.org_name, include_archived)
         for wedding in weddings:
             wedding["id"] = str(wedding["_id"])
             wedding.pop("_id")
         return weddings
-    
\ No newline at end of file
+
+    def archive_weddings(self, before_date: str) -> Dict[str, Any]:
+        # later cutoffs would hide upcoming weddings that update_wedding never restores
+        cutoff = ArchiveService.cutoff_date()
+        if before_date > cutoff:
+            raise ValueError(f"before_date must be on or before {cutoff}")
+        moved = ArchiveService().archive_org(self.org_name, before_date)
+        return {"archived": moved, "before_date": before_date}
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Benchmark for wedding archival.
+Seeds a throwaway organization with weddings spread over several years, then
+measures active-set list latency, WiredTiger cache occupancy (RAM) and on-disk
+sizes before and after archiving.
+Requires a running MongoDB (WiredTiger) reachable via MONGO_URI.
+"""
+
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+from app.db import get_org_collection, drop_org_database
+from app.repositories.master_repo import MasterRepo
+from app.repositories.org_repo import OrgRepo
+from app.services.archive_service import ArchiveService
+
+BENCH_ORG = "BenchArchiveCo"
+TOTAL_WEDDINGS = 50000
+YEARS_OF_HISTORY = 6
+RUNS = 20
+
+def seed_weddings(coll):
+    """Insert weddings dated uniformly over the last YEARS_OF_HISTORY years"""
+    today = date.today()
+    batch = []
+    for i in range(TOTAL_WEDDINGS):
+        wedding_date = today - timedelta(days=random.randint(-180, 365 * YEARS_OF_HISTORY))
+        batch.append({
+            "type": "wedding",
+            "organization": BENCH_ORG,
+            "bride_name": f"Bride {i}",
+            "groom_name": f"Groom {i}",
+            "wedding_date": wedding_date.isoformat(),
+            "venue": f"Venue {i % 200}",
+            "budget": float(random.randint(5000, 100000))
+        })
+        if len(batch) >= 1000:
+            coll.insert_many(batch); batch = []
+    if batch:
+        coll.insert_many(batch)
+
+MB = 1024 * 1024
+
+def collection_stats(coll):
+    """Return (documents, data size MB, storage size MB, index size MB) as reported on disk"""
+    stats = coll.database.command("collStats", coll.name)
+    return (
+        stats.get("count", 0),
+        stats.get("size", 0) / MB,
+        stats.get("storageSize", 0) / MB,
+        stats.get("totalIndexSize", 0) / MB
+    )
+
+def cache_stats(coll):
+    """Return (collection cache MB, index cache MB, total server cache MB) held in the WiredTiger cache"""
+    stats = coll.database.command("collStats", coll.name)
+    in_cache = "bytes currently in the cache"
+    data_bytes = stats.get("wiredTiger", {}).get("cache", {}).get(in_cache, 0)
+    index_bytes = sum(
+        details.get("cache", {}).get(in_cache, 0)
+        for details in stats.get("indexDetails", {}).values()
+    )
+    server = coll.database.client.admin.command("serverStatus")
+    total_bytes = server.get("wiredTiger", {}).get("cache", {}).get(in_cache, 0)
+    return data_bytes / MB, index_bytes / MB, total_bytes / MB
+
+def time_list(repo):
+    """Median latency in ms of listing active weddings"""
+    samples = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        repo.list_weddings(BENCH_ORG)
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return samples[len(samples) // 2]
+
+def report(label, repo):
+    # time_list doubles as the warm-up read, so cache figures reflect the active set
+    latency = time_list(repo)
+    docs, size, storage, index = collection_stats(repo.collection)
+    data_cache, index_cache, total_cache = cache_stats(repo.collection)
+    print(f"\n📊 {label}")
+    print(f"   Active documents: {docs}")
+    print(f"   list_weddings median latency: {latency:.1f} ms")
+    print(f"   RAM - active data in cache: {data_cache:.2f} MB")
+    print(f"   RAM - active indexes in cache: {index_cache:.2f} MB")
+    print(f"   RAM - total WiredTiger cache in use: {total_cache:.2f} MB")
+    print(f"   Disk - active data size: {size:.2f} MB (storage {storage:.2f} MB)")
+    print(f"   Disk - active index size: {index:.2f} MB")
+
+def main():
+    """Run the archive benchmark"""
+    print("🚀 Starting Wedding Archive Benchmark")
+    print("=" * 50)
+
+    # the benchmark drops BENCH_ORG's database; never touch a real tenant
+    if MasterRepo().find_org(BENCH_ORG):
+        print(f"❌ Organization {BENCH_ORG} is registered. Refusing to drop its database.")
+        sys.exit(1)
+
+    drop_org_database(BENCH_ORG)
+    try:
+        print(f"🌱 Seeding {TOTAL_WEDDINGS} weddings...")
+        seed_weddings(get_org_collection(BENCH_ORG))
+        repo = OrgRepo(BENCH_ORG)
+        # build the archiver's index up front so both reports include it
+        repo.collection.create_index([("type", 1), ("wedding_date", 1)])
+        report("Before archiving", repo)
+
+        cutoff = ArchiveService.cutoff_date()
+        start = time.perf_counter()
+        moved = repo.archive_weddings(cutoff)
+        print(f"\n📦 Archived {moved} weddings dated before {cutoff} in {time.perf_counter() - start:.1f} s")
+
+        # rewrite 'data' so pages of moved documents are released from disk and cache
+        try:
+            repo.collection.database.command("compact", repo.collection.name)
+        except Exception as e:
+            print(f"⚠️  compact skipped: {e}")
+
+        report("After archiving", repo)
+        docs, size, storage, index = collection_stats(repo.archive)
+        print("\n🗄️  Archive collection")
+        print(f"   Documents: {docs}")
+        print(f"   Disk - data size: {size:.2f} MB (compressed storage {storage:.2f} MB)")
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+    finally:
+        drop_org_database(BENCH_ORG)
+
+    print("\n" + "=" * 50)
+    print("🎉 Benchmark completed!")
+
+if __name__ == "__main__":
+    main()
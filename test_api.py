@@ -130,6 +130,94 @@ def test_wedding_operations(token):
         print(f"❌ Error: {e}")
         return False
 
+def test_wedding_archive(token):
+    """Test archiving and access to archived weddings"""
+    print("\n🧪 Testing Wedding Archive...")
+
+    headers = {"Authorization": f"Bearer {token}"}
+
+    # Create a wedding dated years ago
+    wedding_data = {
+        "bride_name": "Jane Austen",
+        "groom_name": "Fitzwilliam Darcy",
+        "wedding_date": "2015-05-01",
+        "venue": "Pemberley Hall",
+        "budget": 30000.00
+    }
+
+    try:
+        response = requests.post(f"{BASE_URL}/weddings/", json=wedding_data, headers=headers)
+        if response.status_code != 200:
+            print(f"❌ Failed to create past wedding: {response.text}")
+            return False
+        wedding_id = response.json()['data']['id']
+        print(f"✅ Past wedding created! ID: {wedding_id}")
+
+        ok = True
+
+        # Archive weddings before 2020
+        response = requests.post(f"{BASE_URL}/weddings/archive", params={"before_date": "2020-01-01"}, headers=headers)
+        if response.status_code == 200 and response.json()['data']['archived'] >= 1:
+            print(f"✅ Weddings archived! Count: {response.json()['data']['archived']}")
+        else:
+            print(f"❌ Failed to archive weddings: {response.text}")
+            ok = False
+
+        # Invalid cutoff is rejected
+        response = requests.post(f"{BASE_URL}/weddings/archive", params={"before_date": "z"}, headers=headers)
+        if response.status_code == 422:
+            print("✅ Invalid archive date rejected!")
+        else:
+            print(f"❌ Invalid archive date accepted: {response.text}")
+            ok = False
+
+        # Missing from default list
+        response = requests.get(f"{BASE_URL}/weddings/", headers=headers)
+        ids = [w['id'] for w in response.json()['data']] if response.status_code == 200 else []
+        if response.status_code == 200 and wedding_id not in ids:
+            print("✅ Archived wedding hidden from active list!")
+        else:
+            print(f"❌ Archived wedding still in active list: {response.text}")
+            ok = False
+
+        # Present with include_archived
+        response = requests.get(f"{BASE_URL}/weddings/", params={"include_archived": "true"}, headers=headers)
+        ids = [w['id'] for w in response.json()['data']] if response.status_code == 200 else []
+        if response.status_code == 200 and wedding_id in ids:
+            print("✅ Archived wedding listed with include_archived!")
+        else:
+            print(f"❌ Archived wedding missing with include_archived: {response.text}")
+            ok = False
+
+        # Get archived wedding
+        response = requests.get(f"{BASE_URL}/weddings/{wedding_id}", headers=headers)
+        if response.status_code == 200:
+            print("✅ Archived wedding retrieved successfully!")
+        else:
+            print(f"❌ Failed to get archived wedding: {response.text}")
+            ok = False
+
+        # Update archived wedding
+        response = requests.put(f"{BASE_URL}/weddings/{wedding_id}", json={"budget": 32000.00}, headers=headers)
+        if response.status_code == 200 and response.json()['data']['budget'] == 32000.00:
+            print("✅ Archived wedding updated successfully!")
+        else:
+            print(f"❌ Failed to update archived wedding: {response.text}")
+            ok = False
+
+        # Delete archived wedding
+        response = requests.delete(f"{BASE_URL}/weddings/{wedding_id}", headers=headers)
+        if response.status_code == 200:
+            print("✅ Archived wedding deleted successfully!")
+        else:
+            print(f"❌ Failed to delete archived wedding: {response.text}")
+            ok = False
+
+        return ok
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        return False
+
 def test_health_check():
     """Test health check endpoint"""
     print("\n🧪 Testing Health Check...")
@@ -192,6 +280,10 @@ def main():
     if not test_wedding_operations(token):
         print("\n❌ Wedding operations failed.")
 
+    # Test wedding archive
+    if not test_wedding_archive(token):
+        print("\n❌ Wedding archive failed.")
+
     # Clean up
     cleanup_organization(token)
 